@@ -0,0 +1,34 @@
+import os
+from tests.utilities import PostgresConnection
+
+
+def _is_controller(session):
+    # pytest-xdist workers carry workerinput; the controller (or a run without xdist) does not
+    return not hasattr(session.config, "workerinput") and "PYTEST_XDIST_WORKER" not in os.environ
+
+
+def pytest_sessionstart(session):
+    """
+    Recreates the extension once per run, before any worker connects.
+
+    Workers share the extension and only create their own schema, so none of them can drop it.
+    """
+    if not _is_controller(session):
+        return
+    db = PostgresConnection()
+    db.connect()
+    try:
+        db.recreate_extension()
+    finally:
+        db.close()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _is_controller(session):
+        return
+    db = PostgresConnection()
+    db.connect()
+    try:
+        db.drop_extension()
+    finally:
+        db.close()
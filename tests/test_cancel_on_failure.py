@@ -1,7 +1,7 @@
 import logging
 import unittest
 from psycopg2 import DatabaseError
-from tests.utilities import BaseTestCase
+from tests.utilities import BaseTestCase, INSERT_EMPLOYEE, COUNT_EMPLOYEES
 
 logger = logging.getLogger(__name__)
 
@@ -17,38 +17,30 @@ class TestCancelOnFailure(BaseTestCase):
         # Configure the trigger with cancel_on_failure = true
         retry_number = 2
         retry_interval = 2  # Interval between retries
-        self.db.cur.execute(
-            """
-            SELECT create_event_trigger(
-                name := %s,
-                table_name := %s,
-                operations := %s::text[],
-                webhook_url := 'http://host.docker.internal:8000/webhook',
-                headers := '{"X-API-Key": "test-key"}'::jsonb,
-                timeout := 1,  -- Trigger timeout of 1 second
-                retry_number := %s,
-                retry_interval := %s,
-                retry_backoff := 'LINEAR',
-                cancel_on_failure := true
-            );
-            """,
-            ("employee_cancel_test", "employees", ["INSERT"], retry_number, retry_interval)
+        self.create_event_trigger(
+            name="employee_cancel_test",
+            operations=["INSERT"],
+            timeout=1,  # Trigger timeout of 1 second
+            retry_number=retry_number,
+            retry_interval=retry_interval,
+            retry_backoff="LINEAR",
+            cancel_on_failure=True,
         )
         logger.info("Trigger created with cancel_on_failure=true.")
 
         # Attempt to insert a record to trigger the webhook
         with self.assertRaises(DatabaseError, msg="Transaction should fail due to webhook failure."):
-            self.db.cur.execute("INSERT INTO employees (name, salary) VALUES (%s, %s);", ("Cancel Test", 70000))
+            self.db.cur.execute(INSERT_EMPLOYEE, ("Cancel Test", 70000))
 
         logger.info("Transaction was canceled as expected.")
 
         # Verify that no new record was added to the table
-        self.db.cur.execute("SELECT COUNT(*) FROM employees;")
+        self.db.cur.execute(COUNT_EMPLOYEES)
         employee_count = self.db.cur.fetchone()[0]
         self.assertEqual(employee_count, 0, "No record should exist as the transaction should have been canceled.")
 
         # Verify that webhook attempts were made
-        webhook_received_count = len(self.webhook_server.received_webhooks)
+        webhook_received_count = self.webhook_server.webhook_count
         self.assertGreaterEqual(
             webhook_received_count, 1,
             msg="Expected at least one webhook attempt, but none were received."
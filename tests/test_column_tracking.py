@@ -1,6 +1,6 @@
 import logging
 import unittest
-from tests.utilities import BaseTestCase
+from tests.utilities import BaseTestCase, INSERT_EMPLOYEE
 
 logger = logging.getLogger(__name__)
 
@@ -11,36 +11,29 @@ class TestFullColumnUpdateTracking(BaseTestCase):
 
         # Assume employees table has columns: id, name, salary, created_at
         # Track all columns: id, name, salary, created_at
-        self.db.cur.execute(
-            """
-            SELECT create_event_trigger(
-                name := 'employee_all_columns_update',
-                table_name := 'employees',
-                operations := ARRAY['UPDATE'],
-                webhook_url := 'http://host.docker.internal:8000/webhook',
-                headers := '{"X-API-Key": "test-key"}'::jsonb,
-                update_columns := ARRAY['id','name','salary','created_at']::text[]
-            );
-            """
+        self.create_event_trigger(
+            name="employee_all_columns_update",
+            operations=["UPDATE"],
+            update_columns=["id", "name", "salary", "created_at"],
         )
         logger.info("Trigger for all column updates created successfully.")
 
         # Insert a record
-        self.db.cur.execute("INSERT INTO employees (name, salary) VALUES ('FullTrack', 50000);")
+        self.db.cur.execute(INSERT_EMPLOYEE, ("FullTrack", 50000))
 
         # Update the name (non-salary column)
-        start_index = len(self.webhook_server.received_webhooks)
+        since = self.webhook_server.webhook_count
         self.db.cur.execute("UPDATE employees SET name = 'FullTrackUpdated' WHERE name = 'FullTrack';")
-        webhook = self._wait_for_webhook(start_index=start_index)
+        webhook = self._wait_for_webhook(since=since)
         self.assertEqual(webhook["event"]["op"], "UPDATE")
         self.assertEqual(webhook["event"]["data"]["old"]["name"], "FullTrack")
         self.assertEqual(webhook["event"]["data"]["new"]["name"], "FullTrackUpdated")
         logger.info("UPDATE triggered due to name change.")
 
         # Update the salary column
-        start_index = len(self.webhook_server.received_webhooks)
+        since = self.webhook_server.webhook_count
         self.db.cur.execute("UPDATE employees SET salary = 55000 WHERE name = 'FullTrackUpdated';")
-        webhook = self._wait_for_webhook(start_index=start_index)
+        webhook = self._wait_for_webhook(since=since)
         self.assertEqual(webhook["event"]["data"]["old"]["salary"], 50000)
         self.assertEqual(webhook["event"]["data"]["new"]["salary"], 55000)
         logger.info("UPDATE triggered due to salary change.")
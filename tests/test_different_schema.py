@@ -9,38 +9,28 @@ class TestTriggerWithDifferentSchema(BaseTestCase):
     def test_trigger_in_custom_schema(self):
         logger.info("Testing trigger in a custom schema...")
 
-        # Create a custom schema and table
-        logger.info("Creating custom schema and table...")
-        self.db.cur.execute("CREATE SCHEMA IF NOT EXISTS hr;")
-        self.db.cur.execute("""
-            CREATE TABLE IF NOT EXISTS hr.employees (
-                id SERIAL PRIMARY KEY,
-                name TEXT,
-                salary INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        logger.info("Custom schema and table created.")
+        # Create the custom schema, table and trigger, then INSERT, in a single round trip
+        logger.info("Creating custom schema, table and trigger, and testing INSERT operation...")
+        with self.pipeline() as pipeline:
+            pipeline.execute("CREATE SCHEMA IF NOT EXISTS hr;")
+            pipeline.execute(
+                """
+                CREATE TABLE IF NOT EXISTS hr.employees (
+                    id SERIAL PRIMARY KEY,
+                    name TEXT,
+                    salary INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+                """
+            )
+            pipeline.create_event_trigger(
+                name="hr_employee_changes",
+                operations=["INSERT", "UPDATE", "DELETE"],
+                schema_name="hr",
+            )
+            pipeline.execute("INSERT INTO hr.employees (name, salary) VALUES (%s, %s);", ("Alice", 70000))
+        logger.info("Custom schema, table and trigger created.")
 
-        # Create the trigger for the custom schema table
-        self.db.cur.execute(
-            """
-            SELECT create_event_trigger(
-                name := %s,
-                table_name := %s,
-                operations := %s::text[],
-                webhook_url := 'http://host.docker.internal:8000/webhook',
-                headers := '{"X-API-Key": "test-key"}'::jsonb,
-                schema_name := %s
-            );
-            """,
-            ("hr_employee_changes", "employees", ["INSERT", "UPDATE", "DELETE"], "hr")
-        )
-        logger.info("Trigger for custom schema table created successfully.")
-
-        # Test INSERT operation
-        logger.info("Testing INSERT operation in custom schema...")
-        self.db.cur.execute("INSERT INTO hr.employees (name, salary) VALUES (%s, %s);", ("Alice", 70000))
         webhook = self._wait_for_webhook()
         self.assertEqual(webhook["event"]["op"], "INSERT")
         self.assertEqual(webhook["event"]["data"]["new"]["name"], "Alice")
@@ -48,8 +38,9 @@ class TestTriggerWithDifferentSchema(BaseTestCase):
 
         # Test UPDATE operation
         logger.info("Testing UPDATE operation in custom schema...")
+        since = self.webhook_server.webhook_count
         self.db.cur.execute("UPDATE hr.employees SET salary = %s WHERE name = %s;", (75000, "Alice"))
-        webhook = self._wait_for_webhook(start_index=1)
+        webhook = self._wait_for_webhook(since=since)
         self.assertEqual(webhook["event"]["op"], "UPDATE")
         self.assertEqual(webhook["event"]["data"]["new"]["salary"], 75000)
         self.assertEqual(webhook["event"]["data"]["old"]["salary"], 70000)
@@ -57,8 +48,9 @@ class TestTriggerWithDifferentSchema(BaseTestCase):
 
         # Test DELETE operation
         logger.info("Testing DELETE operation in custom schema...")
+        since = self.webhook_server.webhook_count
         self.db.cur.execute("DELETE FROM hr.employees WHERE name = %s;", ("Alice",))
-        webhook = self._wait_for_webhook(start_index=2)
+        webhook = self._wait_for_webhook(since=since)
         self.assertEqual(webhook["event"]["op"], "DELETE")
         self.assertEqual(webhook["event"]["data"]["old"]["name"], "Alice")
         self.assertIsNone(webhook["event"]["data"]["new"])
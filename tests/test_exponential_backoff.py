@@ -1,7 +1,6 @@
-import time
 import logging
 import unittest
-from tests.utilities import BaseTestCase
+from tests.utilities import BaseTestCase, INSERT_EMPLOYEE
 
 logger = logging.getLogger(__name__)
 
@@ -19,33 +18,26 @@ class TestExponentialBackoff(BaseTestCase):
         # With exponential backoff: attempts at ~0s, ~1s later, ~2s after that (2^n)
         # Actual timing might vary slightly; we focus on number of attempts.
 
-        self.db.cur.execute(
-            """
-            SELECT create_event_trigger(
-                name := 'employee_exponential_test',
-                table_name := 'employees',
-                operations := ARRAY['INSERT'],
-                webhook_url := 'http://host.docker.internal:8000/webhook',
-                headers := '{"X-API-Key": "test-key"}'::jsonb,
-                timeout := 1,
-                retry_number := %s,
-                retry_interval := %s,
-                retry_backoff := 'EXPONENTIAL',
-                cancel_on_failure := false
-            );
-            """,
-            (retry_number, retry_interval)
+        self.create_event_trigger(
+            name="employee_exponential_test",
+            operations=["INSERT"],
+            timeout=1,
+            retry_number=retry_number,
+            retry_interval=retry_interval,
+            retry_backoff="EXPONENTIAL",
+            cancel_on_failure=False,
         )
         logger.info("Trigger with exponential backoff created.")
 
         # Insert a record
-        self.db.cur.execute("INSERT INTO employees (name, salary) VALUES ('ExpBackoff', 70000);")
+        self.db.cur.execute(INSERT_EMPLOYEE, ("ExpBackoff", 70000))
 
         # After the first failed attempt, we expect retries.
-        # Wait enough time for all attempts (0s first attempt, then 1s, then 2s)
-        time.sleep(10)  # More than enough time for all attempts
+        # Return as soon as the last attempt arrives, allowing up to 10s for all of them
+        # (1s timeout per attempt, 1s then 2s of backoff, plus the 3s server delay).
+        self.webhook_server.wait_for_webhook(index=retry_number, timeout=10)
 
-        attempts = len(self.webhook_server.received_webhooks)
+        attempts = self.webhook_server.webhook_count
         self.assertEqual(
             attempts, retry_number + 1,
             f"Expected {retry_number + 1} attempts (1 original + {retry_number} retries), got {attempts}."
@@ -1,7 +1,6 @@
-import time
 import logging
 import unittest
-from tests.utilities import BaseTestCase
+from tests.utilities import BaseTestCase, INSERT_EMPLOYEE
 
 logger = logging.getLogger(__name__)
 
@@ -17,45 +16,40 @@ class TestTimeoutAndRetriesWithoutCancel(BaseTestCase):
         # Configure the trigger with a shorter timeout and retries, without canceling the transaction
         retry_number = 2
         retry_interval = 2  # Interval between retries
-        self.db.cur.execute(
-            """
-            SELECT create_event_trigger(
-                name := %s,
-                table_name := %s,
-                operations := %s::text[],
-                webhook_url := 'http://host.docker.internal:8000/webhook',
-                headers := '{"X-API-Key": "test-key"}'::jsonb,
-                timeout := 1,  -- Trigger timeout of 1 second
-                retry_number := %s,
-                retry_interval := %s,
-                retry_backoff := 'LINEAR',
-                cancel_on_failure := false
-            );
-            """,
-            ("employee_retry_no_rollback", "employees", ["INSERT"], retry_number, retry_interval)
+        self.create_event_trigger(
+            name="employee_retry_no_rollback",
+            operations=["INSERT"],
+            timeout=1,  # Trigger timeout of 1 second
+            retry_number=retry_number,
+            retry_interval=retry_interval,
+            retry_backoff="LINEAR",
+            cancel_on_failure=False,
         )
         logger.info("Trigger created with timeout of 1 second, 2 retries, and no rollback on failure.")
 
         # Insert a record to trigger the webhook
-        self.db.cur.execute("INSERT INTO employees (name, salary) VALUES (%s, %s);", ("Delayed Retry", 60000))
+        self.db.cur.execute(INSERT_EMPLOYEE, ("Delayed Retry", 60000))
         logger.info("Transaction completed successfully, despite webhook delay.")
 
         # Wait for the server delay to complete (allow first webhook attempt)
-        time.sleep(self.webhook_server.response_delay)
+        self.webhook_server.wait_for_webhook(index=0, timeout=self.webhook_server.response_delay)
 
         # Verify that retries started as expected
-        webhook_received_count = len(self.webhook_server.received_webhooks)
+        webhook_received_count = self.webhook_server.webhook_count
         self.assertGreaterEqual(
             webhook_received_count, 1,
             msg="Expected at least 1 webhook attempt by now, but none were received."
         )
 
-        # Wait for retries to complete and validate
+        # Wait for retries to complete and validate; delayed attempts are captured concurrently,
+        # so this returns as soon as the last one arrives
         total_retry_wait = retry_number * retry_interval
-        time.sleep(total_retry_wait)  # Wait only for the remaining retries
+        self.webhook_server.wait_for_webhook(
+            index=retry_number, timeout=self.webhook_server.response_delay + total_retry_wait
+        )
 
         # Validate the total number of webhook attempts
-        webhook_received_count = len(self.webhook_server.received_webhooks)
+        webhook_received_count = self.webhook_server.webhook_count
         self.assertEqual(
             webhook_received_count, retry_number + 1,
             msg=f"Webhook retries did not match expected count. Expected {retry_number + 1}, got {webhook_received_count}."
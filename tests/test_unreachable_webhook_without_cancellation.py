@@ -1,7 +1,7 @@
 import logging
 import unittest
 from psycopg2 import DatabaseError
-from tests.utilities import BaseTestCase
+from tests.utilities import BaseTestCase, INSERT_EMPLOYEE
 
 logger = logging.getLogger(__name__)
 
@@ -11,23 +11,17 @@ class TestUnreachableWebhookURLWithoutCancel(BaseTestCase):
     def test_unreachable_webhook_without_cancellation(self):
         logger.info("Testing unreachable webhook URL with cancel_on_failure=false...")
 
-        self.db.cur.execute(
-            """
-            SELECT create_event_trigger(
-                name := 'unreachable_no_cancel',
-                table_name := 'employees',
-                operations := ARRAY['INSERT'],
-                webhook_url := 'http://nonexistent.webhook.url:9999/',
-                headers := '{"X-API-Key": "test-key"}'::jsonb,
-                cancel_on_failure := false,
-                retry_number := 0
-            );
-            """
+        self.create_event_trigger(
+            name="unreachable_no_cancel",
+            operations=["INSERT"],
+            webhook_url="http://nonexistent.webhook.url:9999/",
+            cancel_on_failure=False,
+            retry_number=0,
         )
         logger.info("Trigger created for unreachable URL without cancellation.")
 
         # Insert should succeed despite unreachable webhook, but log a warning
-        self.db.cur.execute("INSERT INTO employees (name, salary) VALUES ('NoCancel', 45000);")
+        self.db.cur.execute(INSERT_EMPLOYEE, ("NoCancel", 45000))
 
         # Confirm record is inserted
         self.db.cur.execute("SELECT COUNT(*) FROM employees WHERE name = 'NoCancel';")
@@ -1,7 +1,7 @@
 import time
 import logging
 import unittest
-from tests.utilities import BaseTestCase
+from tests.utilities import BaseTestCase, INSERT_EMPLOYEE
 
 logger = logging.getLogger(__name__)
 
@@ -14,24 +14,16 @@ class TestWebhookTimeout(BaseTestCase):
         self.webhook_server.response_delay = 3  # Server will delay responses by 5 seconds
 
         # Create the trigger with a timeout shorter than the server's delay
-        self.db.cur.execute(
-            """
-            SELECT create_event_trigger(
-                name := %s,
-                table_name := %s,
-                operations := %s::text[],
-                webhook_url := 'http://host.docker.internal:8000/webhook',
-                headers := '{"X-API-Key": "test-key"}'::jsonb,
-                timeout := 2,  -- Trigger timeout of 2 seconds
-                retry_number := 0  -- Disable retries
-            );
-            """,
-            ("employee_timeout_test", "employees", ["INSERT"])
+        self.create_event_trigger(
+            name="employee_timeout_test",
+            operations=["INSERT"],
+            timeout=2,  # Trigger timeout of 2 seconds
+            retry_number=0,  # Disable retries
         )
         logger.info("Trigger created with a 2-second timeout.")
         # Measure the time taken to execute the insert
         start_time = time.time()
-        self.db.cur.execute("INSERT INTO employees (name, salary) VALUES (%s, %s);", ("Timeout Test", 10000))
+        self.db.cur.execute(INSERT_EMPLOYEE, ("Timeout Test", 10000))
         end_time = time.time()
         elapsed_time = end_time - start_time
         logger.info(f"Database operation took {elapsed_time:.2f} seconds.")
@@ -52,7 +44,8 @@ class TestWebhookTimeout(BaseTestCase):
         # Verify that the webhook is received after the timeout period
         webhook_received = False
         try:
-            webhook = self._wait_for_webhook(timeout=10)  # Allow sufficient time for delayed webhook
+            # The delayed delivery lands at most response_delay after the insert started
+            webhook = self._wait_for_webhook(timeout=self.webhook_server.response_delay + 1.0)
             webhook_received = True
             logger.info("Webhook received after the timeout, as expected.")
             if webhook_received:
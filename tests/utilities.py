@@ -1,14 +1,91 @@
-from typing import List, Dict, Any
-import requests
-from fastapi import FastAPI, Request
+from typing import Deque, Dict, Any
+import asyncio
+import atexit
+import collections
+import contextlib
+import multiprocessing
+import orjson
+import os
+import random
+import socket
 import threading
 import time
 import psycopg2
+from psycopg2.extras import Json, register_default_jsonb
 import logging
 import unittest
 
 logger = logging.getLogger(__name__)
 
+# Arguments of create_event_trigger, in the order the prepared statement binds them
+TRIGGER_ARGUMENTS = (
+    "name", "table_name", "operations", "webhook_url", "headers", "schema_name", "update_columns", "timeout",
+    "cancel_on_failure", "trigger_timing", "retry_number", "retry_interval", "retry_backoff", "security", "mode",
+)
+
+# Copies of the DEFAULT clauses in the create_event_trigger signature (cdc_webhook--1.0.sql).
+# A NULL argument means "not given" and is replaced by its default here, so tests relying on
+# defaults would silently test these copies if they drifted; setup_environment checks them
+# against the installed function on every run.
+TRIGGER_ARGUMENT_DEFAULTS = {
+    "headers": "'{}'::jsonb",
+    "schema_name": "CURRENT_SCHEMA()",
+    "update_columns": "'{}'::text[]",
+    "timeout": "10",
+    "cancel_on_failure": "false",
+    "trigger_timing": "'AFTER'",
+    "retry_number": "3",
+    "retry_interval": "1",
+    "retry_backoff": "'LINEAR'",
+    "security": "'NONE'",
+    "mode": "'SYNC'",
+}
+
+TRIGGER_ARGUMENT_TYPES = (
+    "text", "text", "text[]", "text", "jsonb", "text", "text[]", "int", "boolean", "text", "int", "int", "text",
+    "text", "text",
+)
+
+
+def _bind_trigger_argument(position, argument):
+    default = TRIGGER_ARGUMENT_DEFAULTS.get(argument)
+    value = f"COALESCE(${position}, {default})" if default else f"${position}"
+    return f"{argument} := {value}"
+
+
+TRIGGER_ARGUMENT_BINDINGS = ",\n        ".join(
+    _bind_trigger_argument(position, argument) for position, argument in enumerate(TRIGGER_ARGUMENTS, start=1)
+)
+
+PREPARE_CREATE_EVENT_TRIGGER = f"""
+    PREPARE create_event_trigger_stmt ({', '.join(TRIGGER_ARGUMENT_TYPES)}) AS
+    SELECT create_event_trigger(
+        {TRIGGER_ARGUMENT_BINDINGS}
+    );
+"""
+
+# The DEFAULT expression of each create_event_trigger argument, NULL where there is none
+TRIGGER_FUNCTION_DEFAULTS_QUERY = """
+SELECT a.arg_name, pg_get_function_arg_default(p.oid, a.arg_position::int)
+FROM pg_proc p, unnest(p.proargnames) WITH ORDINALITY AS a(arg_name, arg_position)
+WHERE p.oid = 'public.create_event_trigger'::regproc;
+"""
+
+EXECUTE_CREATE_EVENT_TRIGGER = f"EXECUTE create_event_trigger_stmt ({', '.join(['%s'] * len(TRIGGER_ARGUMENTS))});"
+
+TRIGGER_DEFINITION_QUERY = """
+WITH t AS (SELECT oid, tgname, tgfoid FROM pg_trigger WHERE tgname = %s AND tgrelid = %s::regclass)
+SELECT t.tgname, t.tgfoid::regproc::text, pg_get_triggerdef(t.oid), pg_get_functiondef(t.tgfoid)
+FROM t;
+"""
+
+INSERT_EMPLOYEE = "INSERT INTO employees (name, salary) VALUES (%s, %s);"
+COUNT_EMPLOYEES = "SELECT COUNT(*) FROM employees;"
+
+
+def _dumps_json(obj):
+    return orjson.dumps(obj).decode()
+
 
 class PostgresConnection:
     def __init__(self, host="localhost", port=5432, dbname="testdb", user="postgres", password=""):
@@ -17,15 +94,28 @@ class PostgresConnection:
         self.dbname = dbname
         self.user = user
         self.password = password
+        # Each pytest-xdist worker gets its own schema so workers never share the employees table
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        self.schema = f"cdc_test_{worker}" if worker else "public"
         self.conn = None
         self.cur = None
+        # Mogrified create_event_trigger calls, keyed by their canonical JSON-encoded arguments
+        self._trigger_statements = {}
 
     def connect(self):
         logger.info("Connecting to PostgreSQL database...")
         self.conn = psycopg2.connect(
-            host=self.host, port=self.port, dbname=self.dbname, user=self.user, password=self.password
+            host=self.host,
+            port=self.port,
+            dbname=self.dbname,
+            user=self.user,
+            password=self.password,
+            options=f"-c search_path={self.schema},public",
+            # The database runs on the loopback interface; libpq already sets TCP_NODELAY itself
+            sslmode="disable",
         )
         self.conn.autocommit = True
+        register_default_jsonb(self.conn, loads=orjson.loads)
         self.cur = self.conn.cursor()
         logger.info("Connected to the database.")
 
@@ -39,7 +129,11 @@ class PostgresConnection:
 
     def setup_environment(self):
         logger.info("Setting up database environment...")
-        self.cur.execute("CREATE EXTENSION IF NOT EXISTS cdc_webhook;")
+        if self.schema == "public":
+            self.cur.execute("CREATE EXTENSION IF NOT EXISTS cdc_webhook SCHEMA public;")
+        else:
+            # Under pytest-xdist the controller recreates the extension once per run (conftest.py)
+            self.cur.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema};")
         self.cur.execute("""
             CREATE TABLE IF NOT EXISTS employees (
                 id SERIAL PRIMARY KEY,
@@ -48,69 +142,480 @@ class PostgresConnection:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
         """)
+        self.check_trigger_argument_defaults()
+        # Parse and plan create_event_trigger once per connection instead of once per test
+        self.cur.execute(PREPARE_CREATE_EVENT_TRIGGER)
         logger.info("Database environment setup complete.")
 
+    def check_trigger_argument_defaults(self):
+        """
+        Verifies that TRIGGER_ARGUMENT_DEFAULTS still matches the installed create_event_trigger.
+
+        Each default is compared by value, by evaluating the function's DEFAULT expression next to ours.
+
+        :raises RuntimeError: If an argument gained, lost or changed its default.
+        """
+        self.cur.execute(TRIGGER_FUNCTION_DEFAULTS_QUERY)
+        function_defaults = {name: default for name, default in self.cur.fetchall() if default is not None}
+        if function_defaults.keys() != TRIGGER_ARGUMENT_DEFAULTS.keys():
+            raise RuntimeError(
+                "create_event_trigger defaults changed arguments: "
+                f"function has {sorted(function_defaults)}, helper has {sorted(TRIGGER_ARGUMENT_DEFAULTS)}"
+            )
+        names = sorted(function_defaults)
+        comparisons = ", ".join(
+            f"({function_defaults[name]}) IS NOT DISTINCT FROM ({TRIGGER_ARGUMENT_DEFAULTS[name]})" for name in names
+        )
+        self.cur.execute(f"SELECT ARRAY[{comparisons}];")
+        mismatched = [name for name, same in zip(names, self.cur.fetchone()[0]) if not same]
+        if mismatched:
+            raise RuntimeError(
+                "TRIGGER_ARGUMENT_DEFAULTS is out of date with create_event_trigger for: "
+                + ", ".join(f"{name} (function default {function_defaults[name]})" for name in mismatched)
+            )
+
+    def create_event_trigger_statement(self, **arguments):
+        """
+        Builds the (sql, params) pair that calls create_event_trigger through the prepared statement.
+
+        The statement is mogrified once per distinct set of arguments and reused afterwards.
+
+        :param arguments: create_event_trigger arguments by name; omitted ones use the function defaults.
+        :return: A (sql, params) pair suitable for cur.execute or execute_script.
+        :raises TypeError: If an argument is not accepted by create_event_trigger.
+        """
+        key = orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)
+        statement = self._trigger_statements.get(key)
+        if statement is None:
+            unknown = set(arguments) - set(TRIGGER_ARGUMENTS)
+            if unknown:
+                raise TypeError(f"Unknown create_event_trigger arguments: {', '.join(sorted(unknown))}")
+            if isinstance(arguments.get("headers"), dict):
+                arguments["headers"] = Json(arguments["headers"], dumps=_dumps_json)
+            params = tuple(arguments.get(argument) for argument in TRIGGER_ARGUMENTS)
+            statement = self._trigger_statements[key] = self.cur.mogrify(EXECUTE_CREATE_EVENT_TRIGGER, params)
+        return statement, None
+
+    def create_event_trigger(self, **arguments):
+        self.cur.execute(*self.create_event_trigger_statement(**arguments))
+
+    def describe_trigger(self, trigger_name, table_name="employees"):
+        """
+        Fetches a trigger and its function in a single query.
+
+        :param trigger_name: The pg_trigger name to look up.
+        :param table_name: The table the trigger is attached to, resolved through the search_path.
+        :return: (trigger_name, function_name, trigger_definition, function_definition), or None if not found.
+        """
+        self.cur.execute(TRIGGER_DEFINITION_QUERY, (trigger_name, table_name))
+        return self.cur.fetchone()
+
+    def execute_script(self, *statements):
+        """
+        Sends several statements to the server in a single round trip.
+
+        :param statements: (sql, params) pairs; params may be None for statements without placeholders.
+        Statements sent together run as one implicit transaction, so a failure rolls back all of them.
+        """
+        script = b"\n".join(self.cur.mogrify(sql, params) for sql, params in statements)
+        self.cur.execute(script)
+
+    @contextlib.contextmanager
+    def pipeline(self, trigger_defaults=None):
+        """
+        Collects statements queued inside the block and sends them with execute_script on exit.
+
+        Nothing is sent if the block raises or queues no statements.
+
+        :param trigger_defaults: create_event_trigger arguments applied to every queued trigger
+            unless it passes its own.
+        :return: A StatementPipeline to queue statements on.
+        """
+        pipeline = StatementPipeline(self, trigger_defaults)
+        yield pipeline
+        # An empty script is an error ("can't execute an empty query")
+        if pipeline.statements:
+            self.execute_script(*pipeline.statements)
+
+    def reset_triggers(self):
+        """
+        Drops the event triggers and stored credentials left behind by a previous test class.
+
+        Only rows for this connection's schema are removed, so other xdist workers are unaffected.
+        """
+        logger.info("Dropping leftover event triggers...")
+        self.cur.execute("""
+            DO $$
+            DECLARE
+                trigger_record RECORD;
+            BEGIN
+                FOR trigger_record IN
+                    SELECT tgname FROM pg_trigger WHERE tgrelid = 'employees'::regclass AND NOT tgisinternal
+                LOOP
+                    EXECUTE format('DROP TRIGGER %I ON employees', trigger_record.tgname);
+                END LOOP;
+            END
+            $$;
+            DELETE FROM cdc_webhook.credentials WHERE trigger_schema = CURRENT_SCHEMA();
+            DELETE FROM cdc_webhook.event_log WHERE trigger_schema = CURRENT_SCHEMA();
+        """)
+        logger.info("Leftover event triggers dropped.")
+
+    def reset_employees(self):
+        """
+        Empties the employees table and restarts its id sequence.
+
+        A plain DELETE avoids the ACCESS EXCLUSIVE lock TRUNCATE takes; replica mode keeps the
+        DELETE from firing the event triggers still attached to the table.
+        """
+        self.cur.execute("""
+            SET LOCAL session_replication_role = replica;
+            DELETE FROM employees;
+            ALTER SEQUENCE employees_id_seq RESTART;
+        """)
+
+    def recreate_extension(self):
+        """
+        Drops and creates the extension, so the run uses the SQL last installed by `make install`.
+        """
+        logger.info("Recreating the cdc_webhook extension...")
+        self.cur.execute("""
+            DROP EXTENSION IF EXISTS cdc_webhook CASCADE;
+            CREATE EXTENSION cdc_webhook SCHEMA public;
+        """)
+
+    def drop_extension(self):
+        self.cur.execute("DROP EXTENSION IF EXISTS cdc_webhook CASCADE;")
+
     def cleanup(self):
         logger.info("Cleaning up database...")
-        self.cur.execute("DROP TABLE IF EXISTS employees CASCADE;")
-        self.cur.execute("DROP EXTENSION IF EXISTS cdc_webhook CASCADE;")
+        if self.schema == "public":
+            self.cur.execute("DROP TABLE IF EXISTS employees CASCADE;")
+            self.drop_extension()
+        else:
+            # Other workers may still be using the extension, so only remove this worker's rows from
+            # its shared tables before dropping the schema; a later run may pick another worker
+            self.cur.execute(
+                """
+                DELETE FROM cdc_webhook.credentials WHERE trigger_schema = %(schema)s;
+                DELETE FROM cdc_webhook.event_log WHERE trigger_schema = %(schema)s;
+                """,
+                {"schema": self.schema},
+            )
+            self.cur.execute(f"DROP SCHEMA IF EXISTS {self.schema} CASCADE;")
         logger.info("Database cleanup complete.")
 
 
+class StatementPipeline:
+    """
+    Statements queued by PostgresConnection.pipeline(), in the order they will run.
+    """
+
+    def __init__(self, db, trigger_defaults=None):
+        self.db = db
+        self.trigger_defaults = trigger_defaults or {}
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        self.statements.append((sql, params))
+
+    def create_event_trigger(self, **arguments):
+        self.statements.append(self.db.create_event_trigger_statement(**{**self.trigger_defaults, **arguments}))
+
+
+_shared_db = None
+_shared_db_lock = threading.Lock()
+
+
+def get_shared_connection():
+    """
+    Returns the process-wide PostgresConnection, connecting and creating the extension on first use.
+
+    The connection is cleaned up and closed when the interpreter exits.
+    """
+    global _shared_db
+    with _shared_db_lock:
+        if _shared_db is None:
+            db = PostgresConnection()
+            db.connect()
+            db.setup_environment()
+            atexit.register(_close_shared_connection)
+            _shared_db = db
+    return _shared_db
+
+
+def _close_shared_connection():
+    global _shared_db
+    with _shared_db_lock:
+        if _shared_db is not None:
+            _shared_db.cleanup()
+            _shared_db.close()
+            _shared_db = None
+
+
+def _json_response(status, content):
+    """
+    Encodes a fixed JSON response once, as the pair of ASGI messages that send it.
+    """
+    start = {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json")],
+    }
+    body = {"type": "http.response.body", "body": orjson.dumps(content)}
+    return start, body
+
+
+# Upper bound on the payloads a WebhookServer keeps in memory
+MAX_RETAINED_WEBHOOKS = 1024
+
+WEBHOOK_RESPONSE = _json_response(200, {"status": "success"})
+NOT_FOUND_RESPONSE = _json_response(404, {"detail": "Not Found"})
+
+
+class _CaptureApp:
+    """
+    Minimal ASGI app serving POST /webhook.
+
+    It runs in the webhook server's own process and hands each raw body, tagged with the
+    generation current when the request arrived, to the test process through a queue.
+    """
+
+    def __init__(self, payloads, response_delay, generation):
+        self.payloads = payloads
+        self.response_delay = response_delay
+        self.generation = generation
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+
+        if (scope["method"], scope["path"]) == ("POST", "/webhook"):
+            generation = self.generation.value
+            delay = self.response_delay.value
+            # Read the body before delaying: once the sender's timeout closes the connection,
+            # receive() only yields http.disconnect and the delivery would be lost
+            body = await self._read_body(receive)
+            if delay:
+                # Never block the event loop here, or concurrent deliveries would queue behind this one
+                await asyncio.sleep(delay)
+            self.payloads.put((generation, body))
+            await self._send(send, WEBHOOK_RESPONSE)
+        else:
+            await self._send(send, NOT_FOUND_RESPONSE)
+
+    @staticmethod
+    async def _read_body(receive):
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        return b"".join(chunks)
+
+    @staticmethod
+    async def _send(send, response):
+        start, body = response
+        await send(start)
+        await send(body)
+
+
+def _run_capture_server(app, sock):
+    from uvicorn import Config, Server
+
+    # Nothing reads the capture server's logs, so don't format any
+    logging.getLogger("uvicorn.error").disabled = True
+    config = Config(
+        app,
+        log_level="critical",
+        use_colors=False,
+        loop="uvloop",
+        http="httptools",
+        ws="none",
+        lifespan="off",
+        access_log=False,
+        interface="asgi3",
+    )
+    Server(config).run(sockets=[sock])
+
+
 class WebhookServer:
-    def __init__(self, host="127.0.0.1", port=8000):
+    def __init__(self, host="127.0.0.1", port=0, public_host="host.docker.internal"):
         self.host = host
+        # Port 0 lets the OS pick a free port, so several servers can run side by side
         self.port = port
-        self.app = FastAPI()
-        self.received_webhooks: List[Dict[str, Any]] = []
-        self.server_thread = None
-        self.server = None
-        self.response_delay = 0
-
-        @self.app.post("/webhook")
-        async def webhook_endpoint(request: Request):
-            time.sleep(self.response_delay)
-            payload = await request.json()
-            self.received_webhooks.append(payload)
-            return {"status": "success"}
-
-        @self.app.get("/health")
-        async def health_check():
-            return {"status": "ok"}
+        # Hostname the database container uses to reach this server
+        self.public_host = public_host
+        # Only the most recent webhooks are kept; webhook_count keeps counting past the bound
+        self.received_webhooks: Deque[Dict[str, Any]] = collections.deque(maxlen=MAX_RETAINED_WEBHOOKS)
+        self.webhook_count = 0
+        self.server_process = None
+        # uvicorn runs in a spawned process so it never competes with the tests for the GIL;
+        # state the tests share with it lives in multiprocessing primitives
+        context = multiprocessing.get_context("spawn")
+        self._payloads = context.Queue()
+        self._response_delay = context.Value("d", 0.0)
+        # Bumped by clear_webhooks() so deliveries still in flight from an earlier test are dropped
+        self._generation = context.Value("i", 0)
+        self._context = context
+        self.app = _CaptureApp(self._payloads, self._response_delay, self._generation)
+        # Payloads are drained on a background thread while tests read from the main thread
+        self._lock = threading.Lock()
+        self._new_webhook = threading.Condition(self._lock)
+        self._drain_thread = None
 
-    def start(self):
-        from uvicorn import Config, Server
+    @property
+    def response_delay(self):
+        return self._response_delay.value
 
-        def run_server():
-            config = Config(self.app, host=self.host, port=self.port, log_level="error")
-            self.server = Server(config)
-            self.server.run()
+    @response_delay.setter
+    def response_delay(self, delay):
+        self._response_delay.value = delay
 
-        logger.info("Starting webhook server...")
-        self.server_thread = threading.Thread(target=run_server, daemon=True)
-        self.server_thread.start()
+    def _start_draining(self):
+        if self._drain_thread is None:
+            self._drain_thread = threading.Thread(target=self._drain_payloads, daemon=True)
+            self._drain_thread.start()
+
+    def _drain_payloads(self):
+        while True:
+            item = self._payloads.get()
+            if item is None:
+                return
+            generation, body = item
+            try:
+                payload = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                # This is the only drain thread; dying here would make every later wait time out
+                logger.warning("Discarding webhook with an undecodable body: %r", body[:200])
+                continue
+            with self._lock:
+                if generation == self._generation.value:
+                    self.received_webhooks.append(payload)
+                    self.webhook_count += 1
+                    self._new_webhook.notify_all()
+
+    @property
+    def webhook_url(self):
+        return f"http://{self.public_host}:{self.port}/webhook"
+
+    def start(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        self.port = sock.getsockname()[1]
+
+        logger.info(f"Starting webhook server on port {self.port}...")
+        self._start_draining()
+        self.server_process = self._context.Process(target=_run_capture_server, args=(self.app, sock), daemon=True)
+        self.server_process.start()
+        # The child process holds its own copy of the socket now
+        sock.close()
         self._wait_for_server_ready()
         logger.info("Webhook server is running.")
 
     def stop(self):
-        if self.server:
+        if self.server_process:
             logger.info("Stopping webhook server...")
-            self.server.should_exit = True
-            self.server_thread.join()
+            self.server_process.terminate()
+            self.server_process.join(timeout=1)
+            if self.server_process.is_alive():
+                self.server_process.kill()
+                self.server_process.join()
             logger.info("Webhook server stopped.")
+        if self._drain_thread is not None:
+            self._payloads.put(None)
+            self._drain_thread.join()
+            self._drain_thread = None
+
+    def clear_webhooks(self):
+        with self._lock:
+            self.received_webhooks.clear()
+            self.webhook_count = 0
+            with self._generation.get_lock():
+                self._generation.value += 1
+
+    def wait_for_webhook(self, index=0, timeout=5):
+        """
+        Blocks until a webhook exists at the given index or the timeout expires.
+
+        :param index: The index of the webhook to wait for, counting from the last clear_webhooks().
+        :param timeout: Maximum time to wait, in seconds.
+        :return: The webhook at the given index, or None if it did not arrive in time.
+        :raises IndexError: If the webhook arrived but has already been evicted from received_webhooks.
+        """
+        with self._new_webhook:
+            if not self._new_webhook.wait_for(lambda: self.webhook_count > index, timeout):
+                return None
+            position = index - (self.webhook_count - len(self.received_webhooks))
+            if position < 0:
+                raise IndexError(f"Webhook {index} is no longer retained")
+            return self.received_webhooks[position]
+
+    def _wait_for_server_ready(self, timeout=10, initial_delay=0.002, max_delay=0.1):
+        """
+        Probes the listening socket with exponential backoff and a little jitter until it accepts.
 
-    def _wait_for_server_ready(self, timeout=10):
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        :raises RuntimeError: If the server process exits, or does not accept connections within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        while time.monotonic() < deadline:
+            if not self.server_process.is_alive():
+                raise RuntimeError(
+                    f"Webhook server process exited with code {self.server_process.exitcode} during startup."
+                )
             try:
-                response = requests.get(f"http://{self.host}:{self.port}/health")
-                if response.status_code == 200 and response.json().get("status") == "ok":
-                    logger.info("Webhook server health check passed.")
+                # A plain TCP connect is enough to know uvicorn is listening
+                with socket.create_connection((self.host, self.port), timeout=max_delay):
+                    logger.info("Webhook server is accepting connections.")
                     return
-            except requests.exceptions.ConnectionError:
+            except OSError:
                 logger.debug("Waiting for webhook server to be ready...")
-                time.sleep(0.1)
-        raise RuntimeError("Webhook server failed to pass health check within the timeout.")
+                time.sleep(delay + random.uniform(0, delay * 0.1))
+                delay = min(delay * 2, max_delay)
+        raise RuntimeError("Webhook server did not accept connections within the timeout.")
+
+
+_shared_webhook_server = None
+_shared_webhook_server_lock = threading.Lock()
+
+
+def get_shared_webhook_server():
+    """
+    Returns the process-wide WebhookServer, starting it on first use.
+
+    The server is stopped when the interpreter exits.
+    """
+    global _shared_webhook_server
+    with _shared_webhook_server_lock:
+        if _shared_webhook_server is None:
+            server = WebhookServer()
+            server.start()
+            atexit.register(_stop_shared_webhook_server)
+            _shared_webhook_server = server
+    return _shared_webhook_server
+
+
+def _stop_shared_webhook_server():
+    global _shared_webhook_server
+    with _shared_webhook_server_lock:
+        if _shared_webhook_server is not None:
+            _shared_webhook_server.stop()
+            _shared_webhook_server = None
+
+
+def get_shared_resources():
+    """
+    Returns the process-wide (PostgresConnection, WebhookServer) pair, creating each on first use.
+    """
+    return get_shared_connection(), get_shared_webhook_server()
+
+
+DEFAULT_WEBHOOK_HEADERS = {"X-API-Key": "test-key"}
 
 
 class BaseTestCase(unittest.TestCase):
@@ -120,42 +625,51 @@ class BaseTestCase(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         logger.info("Setting up test resources...")
-        cls.db = PostgresConnection()
-        cls.db.connect()
-        cls.db.setup_environment()
-
-        cls.webhook_server = WebhookServer()
-        cls.webhook_server.start()
+        cls.db, cls.webhook_server = get_shared_resources()
+        cls.db.reset_triggers()
         logger.info("Test resources set up successfully.")
 
     def setUp(self):
         logger.info("Resetting test environment...")
-        self.db.cur.execute("TRUNCATE employees RESTART IDENTITY CASCADE;")
-        self.webhook_server.received_webhooks.clear()
+        self.db.reset_employees()
+        self.webhook_server.response_delay = 0
+        self.webhook_server.clear_webhooks()
         logger.info("Test environment reset.")
 
-    @classmethod
-    def tearDownClass(cls):
-        logger.info("Tearing down test resources...")
-        if cls.db:
-            cls.db.cleanup()
-            cls.db.close()
-        if cls.webhook_server:
-            cls.webhook_server.stop()
-        logger.info("Test resources torn down.")
+    @property
+    def trigger_defaults(self):
+        """
+        create_event_trigger arguments every test shares: the employees table, the shared webhook
+        server and DEFAULT_WEBHOOK_HEADERS.
+        """
+        return {
+            "table_name": "employees",
+            "webhook_url": self.webhook_server.webhook_url,
+            "headers": DEFAULT_WEBHOOK_HEADERS,
+        }
+
+    def create_event_trigger(self, **arguments):
+        """
+        Creates an event trigger, filling in trigger_defaults for any of them not given.
+        """
+        self.db.create_event_trigger(**{**self.trigger_defaults, **arguments})
+
+    def pipeline(self):
+        """
+        Like PostgresConnection.pipeline(), with trigger_defaults applied to queued triggers.
+        """
+        return self.db.pipeline(trigger_defaults=self.trigger_defaults)
 
-    def _wait_for_webhook(self, timeout=5, start_index=0):
+    def _wait_for_webhook(self, timeout=5, since=0):
         """
-        Waits for a new webhook, starting from the given index.
+        Waits for the first webhook received after webhook_count reached the given value.
 
         :param timeout: Maximum time to wait for a webhook.
-        :param start_index: The index to start checking for new webhooks.
+        :param since: A webhook_count snapshot taken before the triggering statement.
         :return: The newly received webhook.
         :raises AssertionError: If no new webhook is received within the timeout.
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if len(self.webhook_server.received_webhooks) > start_index:
-                return self.webhook_server.received_webhooks[start_index]
-            time.sleep(0.1)
-        raise AssertionError("Webhook not received within timeout")
+        webhook = self.webhook_server.wait_for_webhook(index=since, timeout=timeout)
+        if webhook is None:
+            raise AssertionError("Webhook not received within timeout")
+        return webhook
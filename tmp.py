@@ -1,4 +1,14 @@
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Directories that are never descended into
+EXCLUDED_DIRS = {'.git', '__pycache__', '.venv', 'node_modules'}
+
+# Files included by exact name, and by extension
+INCLUDED_NAMES = frozenset({'Dockerfile', 'Makefile'})
+INCLUDED_EXTENSIONS = frozenset({'.py', '.sql', '.md', '.txt', '.c', '.control'})
+EXCLUDED_SUFFIXES = ('tmp.py',)
 
 
 def get_file_order_priority(filepath):
@@ -29,26 +39,79 @@ def should_include_file(filepath):
     """
     Determine if a file should be included in the output
     """
-    # Exclude git-related files and directories
-    if '.git' in filepath:
-        return False
+    name = os.path.basename(filepath)
+    if name in INCLUDED_NAMES:
+        return True
+    # Match a known extension, excluding temporary files
+    return os.path.splitext(name)[1] in INCLUDED_EXTENSIONS and not name.endswith(EXCLUDED_SUFFIXES)
 
-    # Exclude pycache directories
-    if '__pycache__' in filepath:
-        return False
 
-    # Exclude temporary files
-    if filepath.endswith('.pyc') or filepath.endswith('tmp.py'):
-        return False
+def _scan_directory(path):
+    """
+    List one directory, returning the paths of files to include and
+    of subdirectories to scan, skipping EXCLUDED_DIRS.
+    A directory that cannot be listed is skipped, as os.walk did
+    """
+    files = []
+    subdirectories = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in EXCLUDED_DIRS:
+                        subdirectories.append(entry.path)
+                elif should_include_file(entry.name) and entry.is_file():
+                    files.append(entry.path)
+    except OSError:
+        return [], []
+    return files, subdirectories
+
+
+def _collect_files(directory):
+    """
+    Collect the paths of files to include under directory, scanning
+    subdirectories concurrently on a thread pool
+    """
+    all_files = []
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        pending = [pool.submit(_scan_directory, directory)]
+        while pending:
+            files, subdirectories = pending.pop().result()
+            all_files.extend(files)
+            pending.extend(pool.submit(_scan_directory, subdirectory) for subdirectory in subdirectories)
+    return all_files
 
-    # List of relevant file extensions we want to include
-    valid_extensions = [
-        '.py', '.sql', '.md', '.txt', '.c',
-        'Dockerfile', 'Makefile', '.control'
-    ]
 
-    # Check if the file has a valid extension or is a known file we want
-    return any(filepath.endswith(ext) for ext in valid_extensions)
+def _copy_to_stdout(f, length=65536):
+    """
+    Copy a binary file to stdout without decoding it, in-kernel with
+    os.sendfile where possible and in chunks otherwise.
+    Return whether the copied bytes end with a newline; an empty file
+    does not, so it prints as one empty line as it always has
+    """
+    out = sys.stdout.buffer
+    out.flush()
+    size = os.fstat(f.fileno()).st_size
+    offset = 0
+    try:
+        while offset < size:
+            sent = os.sendfile(out.fileno(), f.fileno(), offset, size - offset)
+            if not sent:
+                break
+            offset += sent
+    except OSError:
+        # stdout does not support sendfile; copy the rest through a buffer
+        pass
+    if offset and offset >= size:
+        return os.pread(f.fileno(), 1, offset - 1) == b"\n"
+
+    f.seek(offset)
+    last = os.pread(f.fileno(), 1, offset - 1) if offset else b""
+    while chunk := f.read(length):
+        out.write(chunk)
+        last = chunk
+    out.flush()
+    return last.endswith(b"\n")
 
 
 def print_directory_contents(directory):
@@ -56,35 +119,35 @@ def print_directory_contents(directory):
     Walk through a directory and print all filenames and their contents
     in markdown format, excluding unwanted files and ordering by priority
     """
-    all_files = []
-
     # First collect all valid files
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            file_path = os.path.join(root, file)
-            if should_include_file(file_path):
-                all_files.append(file_path)
+    all_files = _collect_files(directory)
 
     # Sort files by priority and then alphabetically within each priority level
     all_files.sort(key=lambda x: (get_file_order_priority(x), x.lower()))
 
     # Print files in order
     for file_path in all_files:
-        # Print the filename as a markdown header
-        print(f"\n# {os.path.basename(file_path)}\n")
+        # The filename as a markdown header
+        header = f"\n# {os.path.basename(file_path)}\n\n"
 
+        header_written = False
         try:
-            # Try to read the file contents
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                # Print the contents in a markdown code block
-                print("```")
-                print(content)
-                print("```\n")
+            # Stream the file contents into a markdown code block
+            with open(file_path, 'rb') as f:
+                sys.stdout.write(f"{header}```\n")
+                header_written = True
+                sys.stdout.flush()
+                ends_with_newline = _copy_to_stdout(f)
+            sys.stdout.write("```\n\n" if ends_with_newline else "\n```\n\n")
         except Exception as e:
-            print(f"Error reading file: {e}\n")
+            if header_written:
+                # Part of the file may already be out; report the error and close the open fence
+                sys.stdout.write(f"\nError reading file: {e}\n```\n\n")
+            else:
+                sys.stdout.write(f"{header}Error reading file: {e}\n\n")
 
 
-# Example usage
-directory = "."  # Current directory
-print_directory_contents(directory)
\ No newline at end of file
+if __name__ == "__main__":
+    # Example usage
+    directory = "."  # Current directory
+    print_directory_contents(directory)
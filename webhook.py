@@ -1,16 +1,65 @@
 from fastapi import FastAPI, Request, HTTPException, Security
 from fastapi.security import APIKeyHeader
-import json
+import asyncio
+import collections
+import contextlib
+import functools
+import hmac
+import os
+import sys
+import time
+import orjson
 
-app = FastAPI()
+LOG_BATCH_SIZE = 64
+# Pretty-print logged payloads only when debugging; compact output is a fraction of the size
+DEBUG = os.environ.get("WEBHOOK_DEBUG", "").lower() in ("1", "true", "yes")
+LOG_DUMP_OPTIONS = orjson.OPT_INDENT_2 if DEBUG else 0
+
+
+def _write_payloads(payloads):
+    sys.stdout.buffer.write(b"".join(
+        b"Received payload: " + orjson.dumps(payload, option=LOG_DUMP_OPTIONS) + b"\n"
+        for payload in payloads
+    ))
+    sys.stdout.buffer.flush()
+
+
+async def _drain_log_queue(log_queue):
+    while True:
+        batch = [await log_queue.get()]
+        while len(batch) < LOG_BATCH_SIZE and not log_queue.empty():
+            batch.append(log_queue.get_nowait())
+        _write_payloads(batch)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Received payloads waiting to be logged, written in batches off the request path. The queue
+    # is created here so it belongs to the event loop the server runs on.
+    log_queue = app.state.log_queue = asyncio.Queue()
+    drain_task = asyncio.create_task(_drain_log_queue(log_queue))
+    yield
+    drain_task.cancel()
+    # Log whatever arrived after the last batch
+    pending = []
+    while not log_queue.empty():
+        pending.append(log_queue.get_nowait())
+    if pending:
+        _write_payloads(pending)
+
+
+app = FastAPI(lifespan=lifespan)
 
 # In production, use environment variables
 API_KEY = "your-secret-key-here"
+API_KEY_BYTES = API_KEY.encode()
 api_key_header = APIKeyHeader(name="X-API-Key")
 
 
-async def get_api_key(api_key: str = Security(api_key_header)):
-    if api_key != API_KEY:
+@functools.lru_cache(maxsize=1024)
+def _validate_api_key(api_key: str):
+    # Only accepted keys end up cached; lru_cache does not memoize the raised exception
+    if not hmac.compare_digest(api_key.encode(), API_KEY_BYTES):
         raise HTTPException(
             status_code=403,
             detail="Invalid API key"
@@ -18,17 +67,95 @@ async def get_api_key(api_key: str = Security(api_key_header)):
     return api_key
 
 
+def clear_api_key_cache():
+    """Forget every validated key, e.g. after rotating the API key."""
+    _validate_api_key.cache_clear()
+
+
+async def get_api_key(api_key: str = Security(api_key_header)):
+    return _validate_api_key(api_key)
+
+
+# Delivery ids seen recently, oldest first, so retried deliveries are only processed once.
+# The store lives in each worker process: with several uvicorn workers a retry that lands on
+# a different worker is logged again, so deduplication is only exact with a single worker.
+DEDUP_TTL = 300
+DEDUP_MAX_ENTRIES = 10000
+_seen_deliveries = collections.OrderedDict()
+
+
+def _seen_recently(delivery_id):
+    now = time.monotonic()
+    while _seen_deliveries:
+        oldest_id, seen_at = next(iter(_seen_deliveries.items()))
+        if now - seen_at < DEDUP_TTL:
+            break
+        del _seen_deliveries[oldest_id]
+    return delivery_id in _seen_deliveries
+
+
+def _remember_delivery(delivery_id):
+    _seen_deliveries[delivery_id] = time.monotonic()
+    _seen_deliveries.move_to_end(delivery_id)
+    if len(_seen_deliveries) > DEDUP_MAX_ENTRIES:
+        _seen_deliveries.popitem(last=False)
+
+
+def _claim_delivery(delivery_id):
+    """
+    Record delivery_id as seen and return True, or return False if it already was.
+    Empty and non-string ids are never deduplicated.
+    """
+    if not delivery_id or not isinstance(delivery_id, str):
+        return True
+    if _seen_recently(delivery_id):
+        return False
+    _remember_delivery(delivery_id)
+    return True
+
+
+WEBHOOK_RECEIVED = {"message": "Webhook received successfully"}
+
+
 @app.post("/webhook/")
 async def webhook_endpoint(
         request: Request,
         api_key: str = Security(get_api_key)
 ):
-    payload = await request.json()
-    print("Received payload:", json.dumps(payload, indent=4))
-    return {"message": "Webhook received successfully"}
+    # Prefer an explicit delivery id, claimed before the first await so a concurrent
+    # duplicate cannot slip in while this request's body is being read
+    delivery_id = request.headers.get("x-delivery-id")
+    if not _claim_delivery(delivery_id):
+        return WEBHOOK_RECEIVED
+
+    try:
+        payload = orjson.loads(await request.body())
+    except Exception:
+        # Let the sender's retry through, since this delivery was never accepted
+        if delivery_id:
+            _seen_deliveries.pop(delivery_id, None)
+        raise
+
+    # Otherwise fall back to the event id in the payload, which stays the same across
+    # retries of one trigger firing; nothing is awaited between this check and the enqueue
+    if not delivery_id and isinstance(payload, dict) and not _claim_delivery(payload.get("id")):
+        return WEBHOOK_RECEIVED
+
+    request.app.state.log_queue.put_nowait(payload)
+    return WEBHOOK_RECEIVED
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Pass the app as an import string so each worker process can import it.
+    # Retry deduplication is per worker; see _seen_deliveries.
+    uvicorn.run(
+        "webhook:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+        log_level="warning",
+    )